@@ -1,7 +1,15 @@
+import asyncio
+import functools
+import hashlib
+import json
+
 import instructor
-from pydantic import BaseModel, Field
-from typing import Optional, Type
+import openai
+from pydantic import BaseModel, Field, create_model
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
+from typing import AsyncIterator, Iterator, List, Optional, Type
 from atomic_agents.lib.components.agent_memory import AgentMemory
+from atomic_agents.lib.components.response_cache import BaseResponseCache, response_cache_key
 from atomic_agents.lib.components.system_prompt_generator import (
     SystemPromptContextProviderBase,
     SystemPromptGenerator,
@@ -37,6 +45,175 @@ PartialBase.model_from_chunks = classmethod(model_from_chunks_patched)
 PartialBase.model_from_chunks_async = classmethod(model_from_chunks_async_patched)
 
 
+@functools.lru_cache(maxsize=None)
+def _compiled_response_model(response_model: Type[BaseModel]) -> Type[BaseModel]:
+    """
+    Wraps (and memoizes) a response model with instructor's OpenAISchema.
+
+    instructor rebuilds the tool/function definition from the response model on every
+    call; pre-wrapping the model and pinning the computed schema dict means the JSON
+    schema walk happens once per schema instead of once per turn. The wrapped class
+    subclasses the original, so returned instances still satisfy isinstance checks.
+
+    Args:
+        response_model (Type[BaseModel]): The schema for the response data.
+
+    Returns:
+        Type[BaseModel]: The compiled response model.
+    """
+    from instructor.function_calls import OpenAISchema, openai_schema
+
+    if issubclass(response_model, OpenAISchema):
+        compiled = response_model
+    else:
+        compiled = openai_schema(response_model)
+    # Reading the classproperty computes the schema; assigning it back shadows the
+    # descriptor with the plain dict so later accesses skip the schema walk.
+    compiled.openai_schema = compiled.openai_schema
+    return compiled
+
+
+@functools.lru_cache(maxsize=None)
+def _packed_output_schema(output_schema: Type[BaseModel]) -> Type[BaseIOSchema]:
+    """
+    Builds (and memoizes) the list-of-outputs schema used by `BaseAgent.run_packed`.
+
+    Args:
+        output_schema (Type[BaseModel]): The per-input output schema.
+
+    Returns:
+        Type[BaseIOSchema]: A schema with an `items` list of output_schema instances.
+    """
+    return create_model(
+        f"{output_schema.__name__}Batch",
+        __base__=BaseIOSchema,
+        __doc__=f"A batch of {output_schema.__name__} items, one per numbered input in order.",
+        items=(List[output_schema], Field(..., description="One output per numbered input, in the same order.")),
+    )
+
+
+def _messages_sha1(messages: List[dict]) -> str:
+    """
+    Fingerprints a message list for the prefix-stability check in `BaseAgent`.
+
+    Args:
+        messages (List[dict]): The messages to fingerprint.
+
+    Returns:
+        str: The SHA-1 hex digest of the serialized messages.
+    """
+    return hashlib.sha1(json.dumps(messages, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APITimeoutError)
+_backoff_wait = wait_exponential_jitter(initial=1, max=30)
+
+
+def _retry_wait(retry_state) -> float:
+    """
+    Computes the wait before the next retry attempt.
+
+    If the provider returned a `retry-after` header on a rate-limit response, that
+    exact wait is honored: retrying any earlier is guaranteed to fail again, and
+    waiting longer wastes the quota window. Otherwise falls back to exponential
+    backoff with jitter, capped at 30 seconds, so concurrent workers do not retry
+    in lockstep.
+
+    Args:
+        retry_state: The tenacity retry state for the failed attempt.
+
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    exception = retry_state.outcome.exception() if retry_state.outcome is not None else None
+    if isinstance(exception, openai.RateLimitError) and getattr(exception, "response", None) is not None:
+        retry_after = exception.response.headers.get("retry-after")
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+    return _backoff_wait(retry_state)
+
+
+_llm_retry = retry(
+    retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+    wait=_retry_wait,
+    stop=stop_after_attempt(6),
+    reraise=True,
+)
+
+
+@_llm_retry
+def _create_with_retry(create, **kwargs):
+    """
+    Invokes a completion callable, retrying transient provider errors.
+
+    Rate limits, connection failures and timeouts are retried up to six attempts
+    with `_retry_wait` between them; validation errors and other client-side
+    failures propagate immediately.
+
+    Args:
+        create: The completion callable to invoke.
+        **kwargs: Arguments forwarded to the callable.
+
+    Returns:
+        The callable's return value.
+    """
+    return create(**kwargs)
+
+
+@_llm_retry
+async def _acreate_with_retry(create, **kwargs):
+    """
+    Async counterpart of `_create_with_retry`; waits between attempts with
+    `asyncio.sleep` so the event loop is never blocked.
+
+    Args:
+        create: The async completion callable to invoke.
+        **kwargs: Arguments forwarded to the callable.
+
+    Returns:
+        The awaited return value of the callable.
+    """
+    return await create(**kwargs)
+
+
+class PipelineStep(BaseModel):
+    """
+    Describes one stage of a fused multi-step call for `BaseAgent.run_pipeline`.
+
+    Attributes:
+        name (str): Field name for this step's output in the composite response.
+        prompt_fragment (str): Instruction describing how to produce this step's output.
+        output_schema (Type[BaseModel]): Schema for this step's output.
+    """
+
+    name: str = Field(..., description="Field name for this step's output in the composite response.")
+    prompt_fragment: str = Field(..., description="Instruction describing how to produce this step's output.")
+    output_schema: Type[BaseModel] = Field(..., description="Schema for this step's output.")
+    model_config = {"arbitrary_types_allowed": True}
+
+
+@functools.lru_cache(maxsize=None)
+def _pipeline_schema(fields: tuple) -> Type[BaseIOSchema]:
+    """
+    Builds (and memoizes) the composite schema for `BaseAgent.run_pipeline`.
+
+    Args:
+        fields (tuple): Pairs of (step name, step output schema).
+
+    Returns:
+        Type[BaseIOSchema]: A schema with one field per pipeline step.
+    """
+    return create_model(
+        "PipelineOutputSchema",
+        __base__=BaseIOSchema,
+        __doc__="Composite output containing the result of each pipeline step in order.",
+        **{name: (schema, Field(..., description=f"Output of the '{name}' step.")) for name, schema in fields},
+    )
+
+
 class BaseAgentInputSchema(BaseIOSchema):
     """This schema represents the input from the user to the AI agent."""
 
@@ -76,6 +253,10 @@ class BaseAgentConfig(BaseModel):
         None,
         description="Maximum number of token allowed in the response generation.",
     )
+    response_cache: Optional[BaseResponseCache] = Field(
+        None,
+        description="Optional cache for language model responses; only sensible for deterministic agents.",
+    )
 
 
 class BaseAgent:
@@ -112,16 +293,119 @@ class BaseAgent:
         self.model = config.model
         self.memory = config.memory or AgentMemory()
         self.system_prompt_generator = config.system_prompt_generator or SystemPromptGenerator()
-        self.initial_memory = self.memory.copy()
+        self.initial_memory = self.memory.fast_clone()
         self.current_user_input = None
         self.temperature = config.temperature
         self.max_tokens = config.max_tokens
+        self.response_cache = config.response_cache
+        self._prompt_cache: Optional[tuple] = None
+        self._last_prefix: Optional[tuple] = None
+        # Specialized completion call for the default output schema: the model, schema
+        # and attribute chain are bound once here instead of resolved on every turn.
+        self._fast_create = functools.partial(
+            self.client.chat.completions.create,
+            model=self.model,
+            response_model=_compiled_response_model(self.output_schema),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
 
     def reset_memory(self):
         """
         Resets the memory to its initial state.
         """
-        self.memory = self.initial_memory.copy()
+        self.memory = self.initial_memory.fast_clone()
+        self._last_prefix = None
+
+    def _cached_system_prompt(self) -> str:
+        """
+        Returns the generated system prompt, re-rendering it only when the set of
+        registered context providers changes.
+
+        The cache key fingerprints each provider by name, identity and an optional
+        `version` attribute. Providers whose `get_info` output changes in place should
+        expose an incrementing `version` so the prompt is regenerated; otherwise the
+        cached prompt is reused, which also keeps the prompt prefix byte-stable across
+        turns for provider-side prompt caching.
+
+        Returns:
+            str: The system prompt for the current set of context providers.
+        """
+        key = hash(
+            tuple(
+                (name, id(provider), getattr(provider, "version", 0))
+                for name, provider in sorted(self.system_prompt_generator.context_providers.items())
+            )
+        )
+        if self._prompt_cache is None or self._prompt_cache[0] != key:
+            self._prompt_cache = (key, self.system_prompt_generator.generate_prompt())
+        return self._prompt_cache[1]
+
+    def _build_messages(self, memory: Optional[AgentMemory] = None) -> List[dict]:
+        """
+        Builds the message list sent to the language model: static prefix first, dynamic suffix last.
+
+        The layout is [system prompt, pinned messages, rolling history, current user input].
+        The system prompt is cached and pinned messages are held at the front of the memory,
+        so positions before the newest messages stay byte-identical across turns and
+        provider-side prefix caching can fire. Context providers that inject volatile
+        content (dates, request IDs) invalidate the prefix and should be used sparingly.
+
+        Args:
+            memory (Optional[AgentMemory]): The memory to build from. Defaults to self.memory.
+
+        Returns:
+            List[dict]: The messages for the chat completion call.
+        """
+        return list(self._iter_messages(memory))
+
+    def _iter_messages(self, memory: Optional[AgentMemory] = None) -> Iterator[dict]:
+        """
+        Yields the system prompt followed by the serialized history, one message at a
+        time, so only the single list the SDK requires is ever materialized.
+
+        Args:
+            memory (Optional[AgentMemory]): The memory to iterate. Defaults to self.memory.
+
+        Yields:
+            dict: The next message for the chat completion call.
+        """
+        memory = memory if memory is not None else self.memory
+        yield {
+            "role": "system",
+            "content": self._cached_system_prompt(),
+        }
+        yield from memory.iter_history()
+
+    def _check_prefix_stability(self, messages: List[dict]) -> None:
+        """
+        Dev-only guard that only the tail of the message list changes between calls.
+
+        Provider-side prefix caching reuses the KV cache up to the first changed
+        token, so every position before the newest messages must stay byte-identical
+        across turns: history is append-only and the current user input sits at the
+        tail. If an earlier position changed since the previous call — a mutated
+        history entry, a late pin, a volatile context provider — a RuntimeWarning is
+        emitted so the cache-breaking change is caught during development. The check
+        is skipped entirely under `python -O` via the `__debug__` guard at the call
+        sites. Memory overflow and turn deletion also trigger the warning; both
+        genuinely restart the provider cache.
+
+        Args:
+            messages (List[dict]): The messages about to be sent to the model.
+        """
+        previous = self._last_prefix
+        if previous is not None:
+            count, digest = previous
+            if len(messages) < count or _messages_sha1(messages[:count]) != digest:
+                warnings.warn(
+                    "Message prefix changed since the previous call; provider-side prompt "
+                    "caching re-processes the prompt from the first changed token. Keep "
+                    "history append-only and put volatile content at the tail of the prompt.",
+                    RuntimeWarning,
+                    stacklevel=3,
+                )
+        self._last_prefix = (len(messages), _messages_sha1(messages))
 
     def get_response(self, response_model=None) -> Type[BaseModel]:
         """
@@ -134,25 +418,172 @@ class BaseAgent:
         Returns:
             Type[BaseModel]: The response from the language model.
         """
+        use_fast_path = response_model is None or response_model is self.output_schema
+        if response_model is None:
+            response_model = self.output_schema
+        response_model = _compiled_response_model(response_model)
+
+        messages = self._build_messages()
+        if __debug__:
+            self._check_prefix_stability(messages)
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = response_cache_key(messages, self.model, response_model)
+            cached_response = self.response_cache.get(cache_key, content=messages[-1]["content"])
+            if cached_response is not None:
+                return cached_response
+
+        if use_fast_path:
+            response = _create_with_retry(self._fast_create, messages=messages)
+        else:
+            response = _create_with_retry(
+                self.client.chat.completions.create,
+                messages=messages,
+                model=self.model,
+                response_model=response_model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response, content=messages[-1]["content"])
+
+        return response
+
+    async def aget_response(self, response_model=None) -> Type[BaseModel]:
+        """
+        Obtains a response from the language model asynchronously.
+
+        The configured client must be an `instructor.client.AsyncInstructor`
+        (e.g. created via `instructor.from_openai(openai.AsyncOpenAI())`).
+
+        Args:
+            response_model (Type[BaseModel], optional):
+                The schema for the response data. If not set, self.output_schema is used.
+
+        Returns:
+            Type[BaseModel]: The response from the language model.
+        """
+        use_fast_path = response_model is None or response_model is self.output_schema
         if response_model is None:
             response_model = self.output_schema
+        response_model = _compiled_response_model(response_model)
 
-        messages = [
-            {
-                "role": "system",
-                "content": self.system_prompt_generator.generate_prompt(),
-            }
-        ] + self.memory.get_history()
+        messages = self._build_messages()
+        if __debug__:
+            self._check_prefix_stability(messages)
+
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = response_cache_key(messages, self.model, response_model)
+            cached_response = self.response_cache.get(cache_key, content=messages[-1]["content"])
+            if cached_response is not None:
+                return cached_response
+
+        if use_fast_path:
+            response = await _acreate_with_retry(self._fast_create, messages=messages)
+        else:
+            response = await _acreate_with_retry(
+                self.client.chat.completions.create,
+                messages=messages,
+                model=self.model,
+                response_model=response_model,
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+
+        if cache_key is not None:
+            self.response_cache.put(cache_key, response, content=messages[-1]["content"])
+
+        return response
 
-        response = self.client.chat.completions.create(
+    def stream_response(self, response_model=None) -> Iterator[BaseModel]:
+        """
+        Streams partial responses from the language model synchronously.
+
+        Partially populated instances of the response model are yielded as tokens
+        arrive, so downstream work can start as soon as individual fields
+        crystallize instead of waiting for the full completion.
+
+        Args:
+            response_model (Type[BaseModel], optional):
+                The schema for the response data. If not set, self.output_schema is used.
+
+        Yields:
+            BaseModel: Partial responses from the language model.
+        """
+        if response_model is None:
+            response_model = self.output_schema
+
+        messages = self._build_messages()
+
+        response_stream = self.client.chat.completions.create_partial(
+            model=self.model,
             messages=messages,
+            response_model=response_model,
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+            stream=True,
+        )
+
+        for partial_response in response_stream:
+            yield partial_response
+
+    async def astream_response(self, response_model=None) -> AsyncIterator[BaseModel]:
+        """
+        Streams partial responses from the language model asynchronously.
+
+        The configured client must be an `instructor.client.AsyncInstructor`.
+
+        Args:
+            response_model (Type[BaseModel], optional):
+                The schema for the response data. If not set, self.output_schema is used.
+
+        Yields:
+            BaseModel: Partial responses from the language model.
+        """
+        if response_model is None:
+            response_model = self.output_schema
+
+        messages = self._build_messages()
+
+        response_stream = self.client.chat.completions.create_partial(
             model=self.model,
+            messages=messages,
             response_model=response_model,
             temperature=self.temperature,
             max_tokens=self.max_tokens,
+            stream=True,
         )
 
-        return response
+        async for partial_response in response_stream:
+            yield partial_response
+
+    def run_stream(self, user_input: Optional[BaseIOSchema] = None) -> Iterator[BaseModel]:
+        """
+        Runs the chat agent with the given user input, yielding partial responses synchronously.
+
+        The sync counterpart of `run_async`: the final partial response is validated
+        against the output schema and added to memory once the stream is exhausted.
+
+        Args:
+            user_input (Optional[BaseIOSchema]): The input from the user. If not provided, skips adding to memory.
+
+        Yields:
+            BaseModel: Partial responses from the chat agent.
+        """
+        if user_input:
+            self.memory.initialize_turn()
+            self.current_user_input = user_input
+            self.memory.add_message("user", user_input)
+
+        partial_response = None
+        for partial_response in self.stream_response():
+            yield partial_response
+
+        full_response_content = self.output_schema(**partial_response.model_dump())
+        self.memory.add_message("assistant", full_response_content)
 
     def run(self, user_input: Optional[BaseIOSchema] = None) -> BaseIOSchema:
         """
@@ -174,6 +605,174 @@ class BaseAgent:
 
         return response
 
+    async def arun(self, user_input: Optional[BaseIOSchema] = None) -> BaseIOSchema:
+        """
+        Runs the chat agent with the given user input asynchronously, returning the full response.
+
+        Unlike `run_async`, this does not stream partial responses; it awaits the complete
+        response so that many agents can be overlapped with `asyncio.gather`.
+
+        Args:
+            user_input (Optional[BaseIOSchema]): The input from the user. If not provided, skips adding to memory.
+
+        Returns:
+            BaseIOSchema: The response from the chat agent.
+        """
+        if user_input:
+            self.memory.initialize_turn()
+            self.current_user_input = user_input
+            self.memory.add_message("user", user_input)
+
+        response = await self.aget_response(response_model=self.output_schema)
+        self.memory.add_message("assistant", response)
+
+        return response
+
+    def run_pipeline(self, steps: List[PipelineStep]) -> BaseModel:
+        """
+        Fuses a chain of pure transformation steps into a single structured-output call.
+
+        Instead of one request per step (and a network round-trip between each), the
+        step instructions are concatenated into one user message and the model fills a
+        composite schema containing every intermediate result. Only suitable for
+        deterministic fan-through chains with no external tool calls between steps.
+        The conversation memory is included as context but not modified.
+
+        Args:
+            steps (List[PipelineStep]): The steps to fuse, in execution order.
+
+        Returns:
+            BaseModel: A composite response with one field per step, named after it.
+
+        Raises:
+            ValueError: If no steps are given.
+        """
+        if not steps:
+            raise ValueError("run_pipeline requires at least one step.")
+
+        composite_schema = _pipeline_schema(tuple((step.name, step.output_schema) for step in steps))
+        instruction_lines = [f"Perform the following {len(steps)} steps in order; later steps build on earlier results."]
+        instruction_lines.extend(f"{index}. {step.name}: {step.prompt_fragment}" for index, step in enumerate(steps, 1))
+        instructions = "\n".join(instruction_lines)
+
+        return _create_with_retry(
+            self.client.chat.completions.create,
+            messages=self._build_messages() + [{"role": "user", "content": instructions}],
+            model=self.model,
+            response_model=_compiled_response_model(composite_schema),
+            temperature=self.temperature,
+            max_tokens=self.max_tokens,
+        )
+
+    def run_packed(self, inputs: List[BaseIOSchema], pack_size: int = 20) -> List[BaseIOSchema]:
+        """
+        Runs many independent inputs by packing several of them into each completion request.
+
+        Each chunk of pack_size inputs is enumerated into a single user message and the
+        model returns one output per numbered input, so the system prompt and request
+        overhead are paid once per chunk instead of once per input. Suited to short,
+        independent inputs such as per-chunk classification; memory is neither consulted
+        nor modified.
+
+        Args:
+            inputs (List[BaseIOSchema]): The independent user inputs to process.
+            pack_size (int): Maximum number of inputs packed into one request.
+
+        Returns:
+            List[BaseIOSchema]: One output per input, in the same order as the inputs.
+
+        Raises:
+            ValueError: If the model returns a different number of outputs than a
+                chunk has inputs, which would silently misalign every later result.
+        """
+        batch_schema = _packed_output_schema(self.output_schema)
+        system_message = {
+            "role": "system",
+            "content": self._cached_system_prompt(),
+        }
+
+        results: List[BaseIOSchema] = []
+        for start in range(0, len(inputs), pack_size):
+            chunk = inputs[start : start + pack_size]
+            packed_lines = [
+                f"Process each of the {len(chunk)} numbered inputs below independently "
+                "and return exactly one item per numbered input, in the same order."
+            ]
+            packed_lines.extend(f"[{index}] {item.model_dump_json()}" for index, item in enumerate(chunk))
+            packed_content = "\n".join(packed_lines)
+
+            response = _create_with_retry(
+                self.client.chat.completions.create,
+                messages=[system_message, {"role": "user", "content": packed_content}],
+                model=self.model,
+                response_model=_compiled_response_model(batch_schema),
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+            )
+            if len(response.items) != len(chunk):
+                raise ValueError(
+                    f"run_packed expected {len(chunk)} outputs for inputs "
+                    f"{start}..{start + len(chunk) - 1} but the model returned {len(response.items)}."
+                )
+            results.extend(response.items)
+
+        return results
+
+    async def run_many(
+        self,
+        inputs: List[BaseIOSchema],
+        max_concurrency: int = 32,
+        rpm: Optional[int] = None,
+    ) -> List[BaseIOSchema]:
+        """
+        Runs the chat agent over many independent inputs concurrently.
+
+        Each input is processed against its own copy of the initial memory, so concurrent
+        calls cannot contaminate each other's history and `self.memory` is left untouched.
+        The configured client must be an `instructor.client.AsyncInstructor`.
+
+        Args:
+            inputs (List[BaseIOSchema]): The independent user inputs to process.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            rpm (Optional[int]): Optional requests-per-minute cap, enforced by a token
+                bucket refilled in the background. If not set, only max_concurrency limits
+                the dispatch rate.
+
+        Returns:
+            List[BaseIOSchema]: The responses, in the same order as the inputs.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tokens: Optional[asyncio.Queue] = None
+        refill_task = None
+
+        if rpm is not None:
+            tokens = asyncio.Queue(maxsize=max(rpm // 60, 1))
+            interval = 60.0 / rpm
+
+            async def _refill():
+                while True:
+                    await tokens.put(None)
+                    await asyncio.sleep(interval)
+
+            refill_task = asyncio.create_task(_refill())
+
+        async def _one(user_input: BaseIOSchema) -> BaseIOSchema:
+            async with semaphore:
+                if tokens is not None:
+                    await tokens.get()
+
+                memory = self.initial_memory.fast_clone()
+                memory.initialize_turn()
+                memory.add_message("user", user_input)
+
+                return await _acreate_with_retry(self._fast_create, messages=self._build_messages(memory))
+
+        try:
+            return list(await asyncio.gather(*(_one(user_input) for user_input in inputs)))
+        finally:
+            if refill_task is not None:
+                refill_task.cancel()
+
     async def run_async(self, user_input: Optional[BaseIOSchema] = None):
         """
         Runs the chat agent with the given user input, supporting streaming output asynchronously.
@@ -189,12 +788,7 @@ class BaseAgent:
             self.current_user_input = user_input
             self.memory.add_message("user", user_input)
 
-        messages = [
-            {
-                "role": "system",
-                "content": self.system_prompt_generator.generate_prompt(),
-            }
-        ] + self.memory.get_history()
+        messages = self._build_messages()
 
         response_stream = self.client.chat.completions.create_partial(
             model=self.model,
@@ -255,6 +849,8 @@ class BaseAgent:
             provider (SystemPromptContextProviderBase): The context provider instance.
         """
         self.system_prompt_generator.context_providers[provider_name] = provider
+        self._prompt_cache = None
+        self._last_prefix = None
 
     def unregister_context_provider(self, provider_name: str):
         """
@@ -265,6 +861,8 @@ class BaseAgent:
         """
         if provider_name in self.system_prompt_generator.context_providers:
             del self.system_prompt_generator.context_providers[provider_name]
+            self._prompt_cache = None
+            self._last_prefix = None
         else:
             raise KeyError(f"Context provider '{provider_name}' not found.")
 
@@ -277,9 +875,7 @@ if __name__ == "__main__":
     from rich import box
     from openai import OpenAI, AsyncOpenAI
     import instructor
-    import asyncio
     from rich.live import Live
-    import json
 
     def _create_schema_table(title: str, schema: Type[BaseModel]) -> Table:
         """Create a table displaying schema information.
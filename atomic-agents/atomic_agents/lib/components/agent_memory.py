@@ -1,6 +1,7 @@
+import copy
 import uuid
 import json
-from typing import Dict, List, Optional, Type
+from typing import Dict, Iterator, List, Optional, Type
 from pydantic import BaseModel, Field
 
 from atomic_agents.lib.base.base_io_schema import BaseIOSchema
@@ -14,11 +15,13 @@ class Message(BaseModel):
         role (str): The role of the message sender (e.g., 'user', 'system', 'tool').
         content (BaseIOSchema): The content of the message.
         turn_id (Optional[str]): Unique identifier for the turn this message belongs to.
+        pinned (bool): Whether the message is pinned to the static prefix of the history.
     """
 
     role: str
     content: BaseIOSchema
     turn_id: Optional[str] = None
+    pinned: bool = False
 
 
 class AgentMemory:
@@ -31,6 +34,8 @@ class AgentMemory:
         current_turn_id (Optional[str]): The ID of the current turn.
     """
 
+    __slots__ = ("history", "max_messages", "current_turn_id")
+
     def __init__(self, max_messages: Optional[int] = None):
         """
         Initializes the AgentMemory with an empty history and optional constraints.
@@ -53,28 +58,68 @@ class AgentMemory:
         self,
         role: str,
         content: BaseIOSchema,
+        pinned: bool = False,
     ) -> None:
         """
         Adds a message to the chat history and manages overflow.
 
+        Pinned messages are kept at the front of the history, before the rolling
+        conversation, so that the message prefix stays byte-stable across turns and
+        provider-side prompt caching can reuse it. Pinned messages are never evicted
+        by the max_messages constraint.
+
+        The history is append-only by contract: existing entries are never mutated
+        or reordered, and unpinned messages only ever land at the tail. Pin messages
+        before the conversation starts — inserting a pin later shifts every position
+        behind it and invalidates the cached prefix.
+
         Args:
             role (str): The role of the message sender.
             content (BaseIOSchema): The content of the message.
+            pinned (bool): Whether to pin the message to the static prefix of the history.
         """
         if self.current_turn_id is None:
             self.initialize_turn()
 
-        message = Message(role=role, content=content, turn_id=self.current_turn_id)
-        self.history.append(message)
+        message = Message(role=role, content=content, turn_id=self.current_turn_id, pinned=pinned)
+        if pinned:
+            index = 0
+            while index < len(self.history) and self.history[index].pinned:
+                index += 1
+            self.history.insert(index, message)
+        else:
+            self.history.append(message)
         self._manage_overflow()
 
     def _manage_overflow(self) -> None:
         """
         Manages the chat history overflow based on max_messages constraint.
+        Pinned messages are exempt; the oldest unpinned messages are removed first.
         """
         if self.max_messages is not None:
             while len(self.history) > self.max_messages:
-                self.history.pop(0)
+                for index, message in enumerate(self.history):
+                    if not message.pinned:
+                        del self.history[index]
+                        break
+                else:
+                    break
+
+    def iter_history(self) -> Iterator[Dict]:
+        """
+        Iterates over the chat history as serialized message dictionaries, without
+        building an intermediate list.
+
+        Yields:
+            Dict: The next message in the chat history as a dictionary.
+        """
+        for message in self.history:
+            yield {
+                "role": message.role,
+                # model_dump_json serializes in pydantic-core (Rust), avoiding the
+                # Python-level model_dump + json.dumps round-trip per message.
+                "content": message.content.model_dump_json(),
+            }
 
     def get_history(self) -> List[Dict]:
         """
@@ -83,13 +128,7 @@ class AgentMemory:
         Returns:
             List[Dict]: The list of messages in the chat history as dictionaries.
         """
-        return [
-            {
-                "role": message.role,
-                "content": json.dumps(message.content.model_dump()),
-            }
-            for message in self.history
-        ]
+        return list(self.iter_history())
 
     def copy(self) -> "AgentMemory":
         """
@@ -103,6 +142,22 @@ class AgentMemory:
         new_memory.current_turn_id = self.current_turn_id
         return new_memory
 
+    def fast_clone(self) -> "AgentMemory":
+        """
+        Creates a deep copy of the chat memory without the JSON round-trip of `copy`.
+
+        The history is duplicated with `copy.deepcopy`, which clones the Pydantic
+        message models without re-running validation, making this considerably
+        faster than `copy` for long histories.
+
+        Returns:
+            AgentMemory: A copy of the chat memory.
+        """
+        new_memory = AgentMemory(max_messages=self.max_messages)
+        new_memory.history = copy.deepcopy(self.history)
+        new_memory.current_turn_id = self.current_turn_id
+        return new_memory
+
     def get_current_turn_id(self) -> Optional[str]:
         """
         Returns the current turn ID.
@@ -164,6 +219,7 @@ class AgentMemory:
                     "data": message.content.model_dump(),
                 },
                 "turn_id": message.turn_id,
+                "pinned": message.pinned,
             }
             serialized_history.append(serialized_message)
 
@@ -195,7 +251,12 @@ class AgentMemory:
                 content_class = self._get_class_from_string(content_info["class_name"])
                 content_instance = content_class(**content_info["data"])
 
-                message = Message(role=message_data["role"], content=content_instance, turn_id=message_data["turn_id"])
+                message = Message(
+                    role=message_data["role"],
+                    content=content_instance,
+                    turn_id=message_data["turn_id"],
+                    pinned=message_data.get("pinned", False),
+                )
                 self.history.append(message)
         except (json.JSONDecodeError, KeyError, AttributeError, TypeError) as e:
             raise ValueError(f"Invalid serialized data: {e}")
@@ -0,0 +1,90 @@
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    from atomic_agents.agents.base_agent import BaseAgent
+
+
+class AgentPool:
+    """
+    Recycles agent instances across bulk sub-agent spawns.
+
+    Constructing a fresh agent per sub-query repeats memory construction, prompt
+    generator defaulting and schema binding every time. The pool preallocates a
+    fixed number of agents from a factory and hands them out via acquire/release;
+    released agents get their memory reset before returning to the pool, so each
+    lease starts from the initial memory state.
+
+    Attributes:
+        factory (Callable[[], BaseAgent]): Callable producing a new agent instance.
+        size (int): Number of agents preallocated at construction.
+    """
+
+    __slots__ = ("factory", "size", "_available")
+
+    def __init__(self, factory: Callable[[], "BaseAgent"], size: int):
+        """
+        Initializes the AgentPool and preallocates its agents.
+
+        Args:
+            factory (Callable[[], BaseAgent]): Callable producing a new agent instance.
+            size (int): Number of agents to preallocate. Must be at least 1.
+
+        Raises:
+            ValueError: If size is less than 1.
+        """
+        if size < 1:
+            raise ValueError("AgentPool size must be at least 1.")
+        self.factory = factory
+        self.size = size
+        self._available = deque(factory() for _ in range(size))
+
+    def acquire(self) -> "BaseAgent":
+        """
+        Takes an agent from the pool, creating a new one if the pool is exhausted.
+
+        Returns:
+            BaseAgent: An agent with memory in its initial state.
+        """
+        if self._available:
+            return self._available.popleft()
+        return self.factory()
+
+    def release(self, agent: "BaseAgent") -> None:
+        """
+        Returns an agent to the pool after resetting its memory.
+
+        Args:
+            agent (BaseAgent): The agent to recycle.
+        """
+        agent.reset_memory()
+        self._available.append(agent)
+
+    @contextmanager
+    def lease(self):
+        """
+        Context manager that acquires an agent and releases it on exit.
+
+        Yields:
+            BaseAgent: An agent with memory in its initial state.
+        """
+        agent = self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    @asynccontextmanager
+    async def alease(self):
+        """
+        Async context manager that acquires an agent and releases it on exit.
+
+        Yields:
+            BaseAgent: An agent with memory in its initial state.
+        """
+        agent = self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
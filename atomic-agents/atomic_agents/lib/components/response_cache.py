@@ -0,0 +1,116 @@
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def response_cache_key(messages: List[dict], model: str, response_model: type) -> str:
+    """
+    Computes a stable exact-match cache key for a chat completion call.
+
+    Args:
+        messages (List[dict]): The messages sent to the language model.
+        model (str): The model name.
+        response_model (type): The schema the response is validated against.
+
+    Returns:
+        str: A hex digest identifying the call.
+    """
+    payload = {"messages": messages, "model": model, "response_model": response_model.__name__}
+    if orjson is not None:
+        serialized = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    else:
+        serialized = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.blake2b(serialized).hexdigest()
+
+
+class BaseResponseCache(ABC):
+    """
+    Interface for response caches layered above the language-model call.
+
+    Implementations may be purely exact-match or additionally perform similarity
+    lookups over the last user message (passed as `content`). Response caching is
+    only sensible for deterministic agents (temperature 0); agents sampling at
+    higher temperatures should not be configured with a cache.
+    """
+
+    @abstractmethod
+    def get(self, key: str, content: Optional[str] = None) -> Optional[BaseModel]:
+        """
+        Looks up a cached response.
+
+        Args:
+            key (str): The exact-match cache key.
+            content (Optional[str]): The last user message, for similarity-based lookups.
+
+        Returns:
+            Optional[BaseModel]: The cached response, or None on a miss.
+        """
+        pass
+
+    @abstractmethod
+    def put(self, key: str, value: BaseModel, content: Optional[str] = None) -> None:
+        """
+        Stores a response.
+
+        Args:
+            key (str): The exact-match cache key.
+            value (BaseModel): The response to cache.
+            content (Optional[str]): The last user message, for similarity-based indexing.
+        """
+        pass
+
+
+class InMemoryResponseCache(BaseResponseCache):
+    """
+    Exact-match in-process response cache with optional FIFO eviction.
+
+    Attributes:
+        max_entries (Optional[int]): Maximum number of cached responses. When exceeded,
+            the oldest entries are evicted first. None means unbounded.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        """
+        Initializes the InMemoryResponseCache.
+
+        Args:
+            max_entries (Optional[int]): Maximum number of cached responses to keep.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, BaseModel]" = OrderedDict()
+
+    def get(self, key: str, content: Optional[str] = None) -> Optional[BaseModel]:
+        """
+        Looks up a cached response by exact key.
+
+        Args:
+            key (str): The exact-match cache key.
+            content (Optional[str]): Ignored; this cache is exact-match only.
+
+        Returns:
+            Optional[BaseModel]: The cached response, or None on a miss.
+        """
+        return self._entries.get(key)
+
+    def put(self, key: str, value: BaseModel, content: Optional[str] = None) -> None:
+        """
+        Stores a response and evicts the oldest entries beyond max_entries.
+
+        Args:
+            key (str): The exact-match cache key.
+            value (BaseModel): The response to cache.
+            content (Optional[str]): Ignored; this cache is exact-match only.
+        """
+        self._entries[key] = value
+        if self.max_entries is not None:
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -3,6 +3,8 @@ from typing import Dict, List, Optional
 
 
 class SystemPromptContextProviderBase(ABC):
+    __slots__ = ("title",)
+
     def __init__(self, title: str):
         self.title = title
 
@@ -15,6 +17,8 @@ class SystemPromptContextProviderBase(ABC):
 
 
 class SystemPromptGenerator:
+    __slots__ = ("background", "steps", "output_instructions", "context_providers")
+
     def __init__(
         self,
         background: Optional[List[str]] = None,
@@ -1,5 +1,7 @@
+import json
+
 import pytest
-from unittest.mock import Mock, call, patch
+from unittest.mock import AsyncMock, Mock, call, patch
 from pydantic import BaseModel
 import instructor
 from atomic_agents.agents.base_agent import (
@@ -12,7 +14,17 @@ from atomic_agents.agents.base_agent import (
     AgentMemory,
     SystemPromptContextProviderBase,
 )
+from atomic_agents.agents.base_agent import PipelineStep, _compiled_response_model, _retry_wait
+from atomic_agents.lib.components.response_cache import InMemoryResponseCache
 from instructor.dsl.partial import PartialBase
+import httpx
+import openai
+
+
+def _rate_limit_error(retry_after: str = "0") -> openai.RateLimitError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(429, headers={"retry-after": retry_after}, request=request)
+    return openai.RateLimitError("rate limited", response=response, body=None)
 
 
 @pytest.fixture
@@ -23,12 +35,22 @@ def mock_instructor():
     return mock
 
 
+@pytest.fixture
+def mock_async_instructor():
+    mock = Mock(spec=instructor.client.AsyncInstructor)
+    mock.chat.completions.create = AsyncMock()
+    mock.chat.completions.create_partial = Mock()
+    return mock
+
+
 @pytest.fixture
 def mock_memory():
     mock = Mock(spec=AgentMemory)
     mock.get_history.return_value = []
+    mock.iter_history = Mock(side_effect=lambda: iter(mock.get_history.return_value))
     mock.add_message = Mock()
     mock.copy = Mock(return_value=Mock(spec=AgentMemory))
+    mock.fast_clone = Mock(return_value=Mock(spec=AgentMemory))
     mock.initialize_turn = Mock()
     return mock
 
@@ -71,7 +93,7 @@ def test_reset_memory(agent, mock_memory):
     initial_memory = agent.initial_memory
     agent.reset_memory()
     assert agent.memory != initial_memory
-    mock_memory.copy.assert_called_once()
+    mock_memory.fast_clone.assert_called_once()
 
 
 def test_get_response(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
@@ -88,12 +110,150 @@ def test_get_response(agent, mock_instructor, mock_memory, mock_system_prompt_ge
     mock_instructor.chat.completions.create.assert_called_once_with(
         model="gpt-4o-mini",
         messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
-        response_model=BaseAgentOutputSchema,
+        response_model=_compiled_response_model(BaseAgentOutputSchema),
+        temperature=0,
+        max_tokens=None,
+    )
+
+
+def test_get_response_generic_path_for_custom_model(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
+    class CustomResponseSchema(BaseIOSchema):
+        """Custom Response Schema"""
+
+        result: str
+
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    mock_response = Mock(spec=CustomResponseSchema)
+    mock_instructor.chat.completions.create.return_value = mock_response
+
+    response = agent.get_response(response_model=CustomResponseSchema)
+
+    assert response == mock_response
+    mock_instructor.chat.completions.create.assert_called_once_with(
+        model="gpt-4o-mini",
+        messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
+        response_model=_compiled_response_model(CustomResponseSchema),
         temperature=0,
         max_tokens=None,
     )
 
 
+def test_compiled_response_model_is_memoized():
+    compiled = _compiled_response_model(BaseAgentOutputSchema)
+    assert compiled is _compiled_response_model(BaseAgentOutputSchema)
+    assert issubclass(compiled, BaseAgentOutputSchema)
+    # The tool/function schema is precomputed once and stored as a plain dict.
+    assert isinstance(compiled.openai_schema, dict)
+
+
+def test_get_response_uses_response_cache(mock_instructor, mock_memory, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_instructor,
+        model="gpt-4o-mini",
+        memory=mock_memory,
+        system_prompt_generator=mock_system_prompt_generator,
+        response_cache=InMemoryResponseCache(),
+    )
+    agent = BaseAgent(config)
+
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_response = BaseAgentOutputSchema(chat_message="Test output")
+    mock_instructor.chat.completions.create.return_value = mock_response
+
+    assert agent.get_response() == mock_response
+    assert agent.get_response() == mock_response
+
+    # The second call must be served from the cache without another LLM round-trip.
+    mock_instructor.chat.completions.create.assert_called_once()
+
+
+def test_get_response_retries_rate_limit_errors(agent, mock_instructor, mock_memory):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+
+    mock_response = Mock(spec=BaseAgentOutputSchema)
+    mock_instructor.chat.completions.create.side_effect = [_rate_limit_error(), _rate_limit_error(), mock_response]
+
+    assert agent.get_response() == mock_response
+    assert mock_instructor.chat.completions.create.call_count == 3
+
+
+def test_get_response_gives_up_after_max_attempts(agent, mock_instructor, mock_memory):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_instructor.chat.completions.create.side_effect = _rate_limit_error()
+
+    with pytest.raises(openai.RateLimitError):
+        agent.get_response()
+
+    assert mock_instructor.chat.completions.create.call_count == 6
+
+
+def test_get_response_does_not_retry_non_transient_errors(agent, mock_instructor, mock_memory):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_instructor.chat.completions.create.side_effect = ValueError("invalid schema")
+
+    with pytest.raises(ValueError):
+        agent.get_response()
+
+    mock_instructor.chat.completions.create.assert_called_once()
+
+
+def test_retry_wait_honors_retry_after_header():
+    retry_state = Mock()
+    retry_state.outcome.exception.return_value = _rate_limit_error(retry_after="7")
+
+    assert _retry_wait(retry_state) == 7.0
+
+
+@pytest.mark.asyncio
+async def test_aget_response_retries_rate_limit_errors(mock_async_instructor, mock_memory, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=mock_memory,
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+
+    mock_response = Mock(spec=BaseAgentOutputSchema)
+    mock_async_instructor.chat.completions.create.side_effect = [_rate_limit_error(), mock_response]
+
+    assert await agent.aget_response() == mock_response
+    assert mock_async_instructor.chat.completions.create.call_count == 2
+
+
+def test_get_response_warns_when_prefix_changes(agent, mock_instructor, mock_memory):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_instructor.chat.completions.create.return_value = Mock(spec=BaseAgentOutputSchema)
+
+    agent.get_response()
+
+    # Rewriting an existing history entry changes the prefix and breaks provider caching.
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Rewritten"}]
+    with pytest.warns(RuntimeWarning, match="prefix"):
+        agent.get_response()
+
+
+def test_get_response_appended_messages_keep_prefix_stable(agent, mock_instructor, mock_memory, recwarn):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_instructor.chat.completions.create.return_value = Mock(spec=BaseAgentOutputSchema)
+
+    agent.get_response()
+
+    # Appending new messages at the tail leaves every earlier position untouched.
+    mock_memory.get_history.return_value = [
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi"},
+        {"role": "user", "content": "Next question"},
+    ]
+    agent.get_response()
+
+    assert not [w for w in recwarn if issubclass(w.category, RuntimeWarning)]
+
+
 def test_get_context_provider(agent, mock_system_prompt_generator):
     mock_provider = Mock(spec=SystemPromptContextProviderBase)
     mock_system_prompt_generator.context_providers = {"test_provider": mock_provider}
@@ -124,6 +284,34 @@ def test_unregister_context_provider(agent, mock_system_prompt_generator):
         agent.unregister_context_provider("non_existent_provider")
 
 
+def test_system_prompt_cache_reuses_rendered_prompt(agent, mock_system_prompt_generator):
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    assert agent._cached_system_prompt() == "System prompt"
+    assert agent._cached_system_prompt() == "System prompt"
+    mock_system_prompt_generator.generate_prompt.assert_called_once()
+
+
+def test_system_prompt_cache_invalidated_on_provider_change(agent, mock_system_prompt_generator):
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+    assert agent._cached_system_prompt() == "System prompt"
+
+    mock_provider = Mock(spec=SystemPromptContextProviderBase)
+    agent.register_context_provider("new_provider", mock_provider)
+    mock_system_prompt_generator.generate_prompt.return_value = "Prompt with provider"
+    assert agent._cached_system_prompt() == "Prompt with provider"
+
+    # Providers that change in place signal it by bumping their version.
+    mock_provider.version = 1
+    mock_system_prompt_generator.generate_prompt.return_value = "Prompt with updated provider"
+    assert agent._cached_system_prompt() == "Prompt with updated provider"
+
+    agent.unregister_context_provider("new_provider")
+    mock_system_prompt_generator.generate_prompt.return_value = "Prompt without provider"
+    assert agent._cached_system_prompt() == "Prompt without provider"
+    assert mock_system_prompt_generator.generate_prompt.call_count == 4
+
+
 def test_custom_input_output_schemas(mock_instructor):
     class CustomInputSchema(BaseModel):
         custom_field: str
@@ -192,6 +380,175 @@ def test_base_io_schema_model_json_schema_no_description():
     assert schema["description"] == "Test schema docstring."
 
 
+@pytest.mark.asyncio
+async def test_aget_response(mock_async_instructor, mock_memory, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=mock_memory,
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    mock_response = Mock(spec=BaseAgentOutputSchema)
+    mock_async_instructor.chat.completions.create.return_value = mock_response
+
+    response = await agent.aget_response()
+
+    assert response == mock_response
+
+    mock_async_instructor.chat.completions.create.assert_awaited_once_with(
+        model="gpt-4o-mini",
+        messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
+        response_model=_compiled_response_model(BaseAgentOutputSchema),
+        temperature=0,
+        max_tokens=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_arun(mock_async_instructor, mock_memory, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=mock_memory,
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+    mock_output = BaseAgentOutputSchema(chat_message="Test output")
+    mock_async_instructor.chat.completions.create.return_value = mock_output
+
+    result = await agent.arun(mock_input)
+
+    assert result == mock_output
+    assert agent.current_user_input == mock_input
+
+    mock_memory.add_message.assert_has_calls([call("user", mock_input), call("assistant", mock_output)])
+
+
+def test_run_pipeline(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
+    class QuerySchema(BaseIOSchema):
+        """Query Schema"""
+
+        query: str
+
+    class SummarySchema(BaseIOSchema):
+        """Summary Schema"""
+
+        summary: str
+
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+    steps = [
+        PipelineStep(name="queries", prompt_fragment="Generate a search query.", output_schema=QuerySchema),
+        PipelineStep(name="summary", prompt_fragment="Summarize the findings.", output_schema=SummarySchema),
+    ]
+
+    def composite_echo(messages, response_model, **kwargs):
+        return response_model(queries=QuerySchema(query="q"), summary=SummarySchema(summary="s"))
+
+    mock_instructor.chat.completions.create.side_effect = composite_echo
+
+    result = agent.run_pipeline(steps)
+
+    assert result.queries.query == "q"
+    assert result.summary.summary == "s"
+    # One fused request replaces the per-step chain.
+    mock_instructor.chat.completions.create.assert_called_once()
+    instructions = mock_instructor.chat.completions.create.call_args.kwargs["messages"][-1]["content"]
+    assert "1. queries" in instructions
+    assert "2. summary" in instructions
+
+
+def test_run_pipeline_requires_steps(agent):
+    with pytest.raises(ValueError):
+        agent.run_pipeline([])
+
+
+def test_run_packed(agent, mock_instructor, mock_memory, mock_system_prompt_generator):
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+    inputs = [BaseAgentInputSchema(chat_message=f"Input {i}") for i in range(5)]
+
+    def pack_echo(messages, response_model, **kwargs):
+        numbered_lines = [line for line in messages[-1]["content"].splitlines() if line.startswith("[")]
+        return response_model(items=[BaseAgentOutputSchema(chat_message=f"Output for {line}") for line in numbered_lines])
+
+    mock_instructor.chat.completions.create.side_effect = pack_echo
+
+    results = agent.run_packed(inputs, pack_size=2)
+
+    assert len(results) == 5
+    assert all(isinstance(result, BaseAgentOutputSchema) for result in results)
+    # Five inputs at pack_size 2 need three requests instead of five.
+    assert mock_instructor.chat.completions.create.call_count == 3
+    mock_memory.add_message.assert_not_called()
+
+
+def test_run_packed_raises_on_output_count_mismatch(agent, mock_instructor, mock_system_prompt_generator):
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+    inputs = [BaseAgentInputSchema(chat_message=f"Input {i}") for i in range(2)]
+
+    def drop_one(messages, response_model, **kwargs):
+        return response_model(items=[BaseAgentOutputSchema(chat_message="Only output")])
+
+    mock_instructor.chat.completions.create.side_effect = drop_one
+
+    # A short (or long) items list would silently shift every later result.
+    with pytest.raises(ValueError, match="expected 2 outputs"):
+        agent.run_packed(inputs, pack_size=2)
+
+
+@pytest.mark.asyncio
+async def test_run_many_preserves_order_and_memory(mock_async_instructor, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=AgentMemory(),
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    inputs = [BaseAgentInputSchema(chat_message=f"Input {i}") for i in range(5)]
+
+    async def echo(messages, **kwargs):
+        return BaseAgentOutputSchema(chat_message=messages[-1]["content"])
+
+    mock_async_instructor.chat.completions.create.side_effect = echo
+
+    results = await agent.run_many(inputs, max_concurrency=2)
+
+    assert [json.loads(r.chat_message)["chat_message"] for r in results] == [f"Input {i}" for i in range(5)]
+    # The shared memory must not be polluted by the batch.
+    assert agent.memory.get_message_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_run_many_with_rate_limit(mock_async_instructor, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=AgentMemory(),
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    mock_output = BaseAgentOutputSchema(chat_message="Test output")
+    mock_async_instructor.chat.completions.create.return_value = mock_output
+
+    results = await agent.run_many(
+        [BaseAgentInputSchema(chat_message="Input")] * 3,
+        max_concurrency=2,
+        rpm=6000,
+    )
+
+    assert results == [mock_output] * 3
+    assert mock_async_instructor.chat.completions.create.await_count == 3
+
+
 @pytest.mark.asyncio
 async def test_run_async(agent, mock_memory):
     mock_input = BaseAgentInputSchema(chat_message="Test input")
@@ -218,6 +575,73 @@ async def test_run_async(agent, mock_memory):
     mock_memory.add_message.assert_has_calls([call("user", mock_input), call("assistant", mock_output)])
 
 
+def test_stream_response(agent, mock_memory, mock_instructor, mock_system_prompt_generator):
+    mock_memory.get_history.return_value = [{"role": "user", "content": "Hello"}]
+    mock_system_prompt_generator.generate_prompt.return_value = "System prompt"
+
+    partial_responses = [
+        BaseAgentOutputSchema(chat_message="Partial response 1"),
+        BaseAgentOutputSchema(chat_message="Final response"),
+    ]
+    mock_instructor.chat.completions.create_partial.return_value = iter(partial_responses)
+
+    responses = list(agent.stream_response())
+
+    assert responses == partial_responses
+    mock_instructor.chat.completions.create_partial.assert_called_once_with(
+        model="gpt-4o-mini",
+        messages=[{"role": "system", "content": "System prompt"}, {"role": "user", "content": "Hello"}],
+        response_model=BaseAgentOutputSchema,
+        temperature=0,
+        max_tokens=None,
+        stream=True,
+    )
+
+
+def test_run_stream(agent, mock_memory, mock_instructor):
+    mock_input = BaseAgentInputSchema(chat_message="Test input")
+
+    partial_responses = [
+        BaseAgentOutputSchema(chat_message="Partial response 1"),
+        BaseAgentOutputSchema(chat_message="Final response"),
+    ]
+    mock_instructor.chat.completions.create_partial.return_value = iter(partial_responses)
+
+    responses = list(agent.run_stream(mock_input))
+
+    assert responses == partial_responses
+    assert agent.current_user_input == mock_input
+    mock_memory.add_message.assert_has_calls([call("user", mock_input), call("assistant", partial_responses[-1])])
+
+
+@pytest.mark.asyncio
+async def test_astream_response(mock_async_instructor, mock_memory, mock_system_prompt_generator):
+    config = BaseAgentConfig(
+        client=mock_async_instructor,
+        model="gpt-4o-mini",
+        memory=mock_memory,
+        system_prompt_generator=mock_system_prompt_generator,
+    )
+    agent = BaseAgent(config)
+
+    partial_responses = [
+        BaseAgentOutputSchema(chat_message="Partial response 1"),
+        BaseAgentOutputSchema(chat_message="Final response"),
+    ]
+
+    async def mock_create_partial(*args, **kwargs):
+        for response in partial_responses:
+            yield response
+
+    mock_async_instructor.chat.completions.create_partial = mock_create_partial
+
+    responses = []
+    async for partial_response in agent.astream_response():
+        responses.append(partial_response)
+
+    assert responses == partial_responses
+
+
 @pytest.mark.asyncio
 async def test_stream_response_async(agent, mock_memory, mock_instructor, mock_system_prompt_generator):
     mock_input = BaseAgentInputSchema(chat_message="Test input")
@@ -73,6 +73,60 @@ def test_manage_overflow(memory):
     assert memory.history[0].content.test_field == "Message 2"
 
 
+def test_add_pinned_message_kept_at_front(memory):
+    memory.add_message("user", TestInputSchema(test_field="Rolling message"))
+    memory.add_message("system", TestInputSchema(test_field="Pinned context"), pinned=True)
+    assert memory.history[0].pinned
+    assert memory.history[0].content.test_field == "Pinned context"
+    assert memory.history[1].content.test_field == "Rolling message"
+
+
+def test_manage_overflow_skips_pinned_messages(memory):
+    memory.add_message("system", TestInputSchema(test_field="Pinned context"), pinned=True)
+    for i in range(7):
+        memory.add_message("user", TestInputSchema(test_field=f"Message {i}"))
+    assert len(memory.history) == 5
+    assert memory.history[0].content.test_field == "Pinned context"
+    assert memory.history[1].content.test_field == "Message 3"
+
+
+def test_dump_and_load_preserve_pinned(memory):
+    memory.add_message("system", TestInputSchema(test_field="Pinned context"), pinned=True)
+    memory.add_message("user", TestInputSchema(test_field="Hello"))
+
+    loaded = AgentMemory()
+    loaded.load(memory.dump())
+
+    assert loaded.history[0].pinned
+    assert not loaded.history[1].pinned
+
+
+def test_iter_history_matches_get_history(memory):
+    memory.add_message("user", TestInputSchema(test_field="Hello"))
+    memory.add_message("assistant", TestOutputSchema(test_field="Hi there"))
+
+    iterator = memory.iter_history()
+    assert not isinstance(iterator, list)
+    assert list(iterator) == memory.get_history()
+
+
+def test_fast_clone(memory):
+    memory.add_message("user", TestInputSchema(test_field="Hello"))
+    memory.add_message("assistant", TestOutputSchema(test_field="Hi there"))
+
+    cloned = memory.fast_clone()
+
+    assert cloned.dump() == memory.dump()
+    assert cloned.max_messages == memory.max_messages
+    assert cloned.current_turn_id == memory.current_turn_id
+
+    # Mutating the clone must not touch the original.
+    cloned.add_message("user", TestInputSchema(test_field="Only in clone"))
+    cloned.history[0].content.test_field = "Changed in clone"
+    assert memory.get_message_count() == 2
+    assert memory.history[0].content.test_field == "Hello"
+
+
 def test_get_history(memory):
     memory.add_message("user", TestInputSchema(test_field="Hello"))
     memory.add_message("assistant", TestOutputSchema(test_field="Hi there"))
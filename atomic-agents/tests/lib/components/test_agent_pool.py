@@ -0,0 +1,63 @@
+import pytest
+from unittest.mock import Mock
+
+from atomic_agents.agents.base_agent import BaseAgent
+from atomic_agents.lib.components.agent_pool import AgentPool
+
+
+@pytest.fixture
+def factory():
+    return Mock(side_effect=lambda: Mock(spec=BaseAgent))
+
+
+def test_pool_preallocates_agents(factory):
+    AgentPool(factory, size=3)
+    assert factory.call_count == 3
+
+
+def test_pool_rejects_invalid_size(factory):
+    with pytest.raises(ValueError):
+        AgentPool(factory, size=0)
+
+
+def test_acquire_release_recycles_agents(factory):
+    pool = AgentPool(factory, size=1)
+
+    agent = pool.acquire()
+    pool.release(agent)
+    agent.reset_memory.assert_called_once()
+
+    # The same instance comes back instead of a new construction.
+    assert pool.acquire() is agent
+    assert factory.call_count == 1
+
+
+def test_acquire_grows_when_exhausted(factory):
+    pool = AgentPool(factory, size=1)
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert first is not second
+    assert factory.call_count == 2
+
+
+def test_lease_releases_on_exit(factory):
+    pool = AgentPool(factory, size=1)
+
+    with pool.lease() as agent:
+        assert isinstance(agent, Mock)
+
+    agent.reset_memory.assert_called_once()
+    assert pool.acquire() is agent
+
+
+@pytest.mark.asyncio
+async def test_alease_releases_on_exit(factory):
+    pool = AgentPool(factory, size=1)
+
+    async with pool.alease() as agent:
+        assert isinstance(agent, Mock)
+
+    agent.reset_memory.assert_called_once()
+    assert pool.acquire() is agent
@@ -0,0 +1,49 @@
+from pydantic import Field
+
+from atomic_agents.lib.base.base_io_schema import BaseIOSchema
+from atomic_agents.lib.components.response_cache import InMemoryResponseCache, response_cache_key
+
+
+class TestResponseSchema(BaseIOSchema):
+    """Test Response Schema"""
+
+    test_field: str = Field(..., description="A test field")
+
+
+class OtherResponseSchema(BaseIOSchema):
+    """Other Response Schema"""
+
+    test_field: str = Field(..., description="A test field")
+
+
+def test_response_cache_key_is_stable():
+    messages = [{"role": "user", "content": "Hello"}]
+    key = response_cache_key(messages, "gpt-4o-mini", TestResponseSchema)
+    assert key == response_cache_key(messages, "gpt-4o-mini", TestResponseSchema)
+
+
+def test_response_cache_key_varies_with_inputs():
+    messages = [{"role": "user", "content": "Hello"}]
+    key = response_cache_key(messages, "gpt-4o-mini", TestResponseSchema)
+    assert key != response_cache_key([{"role": "user", "content": "Hi"}], "gpt-4o-mini", TestResponseSchema)
+    assert key != response_cache_key(messages, "gpt-4o", TestResponseSchema)
+    assert key != response_cache_key(messages, "gpt-4o-mini", OtherResponseSchema)
+
+
+def test_in_memory_cache_roundtrip():
+    cache = InMemoryResponseCache()
+    response = TestResponseSchema(test_field="Hello")
+
+    assert cache.get("key") is None
+    cache.put("key", response)
+    assert cache.get("key") == response
+
+
+def test_in_memory_cache_evicts_oldest():
+    cache = InMemoryResponseCache(max_entries=2)
+    for i in range(3):
+        cache.put(f"key{i}", TestResponseSchema(test_field=f"Value {i}"))
+
+    assert cache.get("key0") is None
+    assert cache.get("key1") is not None
+    assert cache.get("key2") is not None
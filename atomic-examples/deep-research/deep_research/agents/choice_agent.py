@@ -1,11 +1,9 @@
-import instructor
-import openai
 from pydantic import Field
 from atomic_agents.agents.base_agent import BaseIOSchema, BaseAgent, BaseAgentConfig
 from atomic_agents.lib.components.system_prompt_generator import SystemPromptGenerator
 
-from deep_research.config import ChatConfig
-from deep_research.agents.client import client
+from deep_research.config import settings
+from deep_research.agents.client import get_sync_client
 
 
 class ChoiceAgentInputSchema(BaseIOSchema):
@@ -24,8 +22,8 @@ class ChoiceAgentOutputSchema(BaseIOSchema):
 
 choice_agent = BaseAgent(
     BaseAgentConfig(
-        client=instructor.from_openai(client),
-        model=ChatConfig.model,
+        client=get_sync_client(),
+        model=settings.model,
         system_prompt_generator=SystemPromptGenerator(
             background=[
                 "You are a decision-making agent that determines whether a new web search is needed to answer the user's question.",
@@ -1,17 +1,74 @@
+from functools import lru_cache
+
+import httpx
+import instructor
 import openai
-import os
 
-from deep_research.config import ChatConfig
+from deep_research.config import settings
+
+
+def _http_client_kwargs() -> dict:
+    """
+    Shared httpx client settings: HTTP/2 so many in-flight requests multiplex over a
+    few TLS sessions, and a pool sized to the concurrency cap used by
+    BaseAgent.run_many (configurable via HTTP_POOL_SIZE).
+    """
+    return dict(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=settings.http_pool_size,
+            max_keepalive_connections=settings.http_pool_size // 2,
+        ),
+        timeout=httpx.Timeout(60.0, connect=5.0),
+    )
 
-# Setzen Sie Ihre Azure OpenAI-Endpoint-URL und den Namen des Modells
-azure_openai_endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
-deployment_name = os.getenv("AZURE_DEPLOYMENT") 
-api_key = os.getenv("AZURE_API_KEY") 
 
-if (ChatConfig.use_azure):
-    client = openai.AzureOpenAI(azure_endpoint=azure_openai_endpoint, azure_deployment=deployment_name, api_key=api_key, api_version="2023-05-15")
-else:
-    if (ChatConfig.base_url):
-        client = openai.OpenAI(api_key=ChatConfig.api_key, base_url=ChatConfig.base_url)
+@lru_cache(maxsize=None)
+def get_client() -> instructor.client.AsyncInstructor:
+    """
+    Returns the shared AsyncInstructor client, created lazily on first use.
+
+    Building the client on demand avoids TLS/connection-pool setup at import time
+    and lets test harnesses adjust environment variables (e.g. via load_dotenv)
+    before the first call.
+    """
+    http_client = httpx.AsyncClient(**_http_client_kwargs())
+
+    if settings.use_azure:
+        # Setzen Sie Ihre Azure OpenAI-Endpoint-URL und den Namen des Modells
+        client = openai.AsyncAzureOpenAI(
+            azure_endpoint=settings.azure_endpoint,
+            azure_deployment=settings.azure_deployment,
+            api_key=settings.azure_api_key,
+            api_version="2023-05-15",
+            http_client=http_client,
+        )
+    elif settings.base_url:
+        client = openai.AsyncOpenAI(api_key=settings.api_key, base_url=settings.base_url, http_client=http_client)
     else:
-        client = openai.OpenAI(api_key=ChatConfig.api_key)
\ No newline at end of file
+        client = openai.AsyncOpenAI(api_key=settings.api_key, http_client=http_client)
+
+    return instructor.from_openai(client)
+
+
+@lru_cache(maxsize=None)
+def get_sync_client() -> instructor.client.Instructor:
+    """
+    Returns the shared synchronous Instructor client, created lazily on first use.
+    """
+    http_client = httpx.Client(**_http_client_kwargs())
+
+    if settings.use_azure:
+        client = openai.AzureOpenAI(
+            azure_endpoint=settings.azure_endpoint,
+            azure_deployment=settings.azure_deployment,
+            api_key=settings.azure_api_key,
+            api_version="2023-05-15",
+            http_client=http_client,
+        )
+    elif settings.base_url:
+        client = openai.OpenAI(api_key=settings.api_key, base_url=settings.base_url, http_client=http_client)
+    else:
+        client = openai.OpenAI(api_key=settings.api_key, http_client=http_client)
+
+    return instructor.from_openai(client)
@@ -1,11 +1,10 @@
-import instructor
-import openai
 from pydantic import Field
 from atomic_agents.agents.base_agent import BaseIOSchema, BaseAgent, BaseAgentConfig
 from atomic_agents.lib.components.system_prompt_generator import SystemPromptGenerator
 
-from deep_research.config import ChatConfig
-from deep_research.agents.client import client
+from deep_research.config import settings
+from deep_research.agents.client import get_sync_client
+
 
 class QuestionAnsweringAgentInputSchema(BaseIOSchema):
     """This is the input schema for the QuestionAnsweringAgent."""
@@ -26,10 +25,11 @@ class QuestionAnsweringAgentOutputSchema(BaseIOSchema):
         ),
     )
 
+
 question_answering_agent = BaseAgent(
     BaseAgentConfig(
-        client=instructor.from_openai(client),
-        model=ChatConfig.model,
+        client=get_sync_client(),
+        model=settings.model,
         system_prompt_generator=SystemPromptGenerator(
             background=[
                 "You are an expert question answering agent focused on providing factual information and encouraging deeper topic exploration.",
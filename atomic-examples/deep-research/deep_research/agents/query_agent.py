@@ -1,12 +1,12 @@
-from deep_research.config import ChatConfig
-import instructor
-import openai
+from deep_research.config import settings
+
 from pydantic import Field
 from atomic_agents.agents.base_agent import BaseIOSchema, BaseAgent, BaseAgentConfig
 from atomic_agents.lib.components.system_prompt_generator import SystemPromptGenerator
 
 from deep_research.tools.searxng_search import SearxNGSearchTool
-from deep_research.agents.client import client
+from deep_research.agents.client import get_sync_client
+
 
 class QueryAgentInputSchema(BaseIOSchema):
     """This is the input schema for the QueryAgent."""
@@ -17,8 +17,8 @@ class QueryAgentInputSchema(BaseIOSchema):
 
 query_agent = BaseAgent(
     BaseAgentConfig(
-        client=instructor.from_openai(client),
-        model=ChatConfig.model,
+        client=get_sync_client(),
+        model=settings.model,
         system_prompt_generator=SystemPromptGenerator(
             background=[
                 (
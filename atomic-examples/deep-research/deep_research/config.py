@@ -1,28 +1,31 @@
-import os
-from dataclasses import dataclass
-from typing import Set
-from dotenv import load_dotenv
-
-load_dotenv()
-
-def get_api_key() -> str:
-    """Retrieve API key from environment or raise error"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise ValueError("API key not found. Please set the OPENAI_API_KEY environment variable.")
-    return api_key
-
-
-@dataclass
-class ChatConfig:
-    """Configuration for the chat application"""
-
-    api_key: str = get_api_key()  # This becomes a class variable
-    model: str = os.getenv("CLIENT_TYPE") == "azure" and os.getenv("AZURE_DEPLOYMENT") or os.getenv("OPENAI_MODEL")
-    exit_commands: Set[str] = frozenset({"/exit", "/quit"})
-    base_url: str = os.getenv("OPENAI_BASE_URL", "") #"http://localhost:8000/v1"
-    use_azure: bool = os.getenv("CLIENT_TYPE") == "azure"
-
-    def __init__(self):
-        # Prevent instantiation
-        raise TypeError("ChatConfig is not meant to be instantiated")
+from typing import FrozenSet, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    """Configuration for the chat application, loaded once from the environment."""
+
+    model_config = SettingsConfigDict(env_file=".env", frozen=True, extra="ignore")
+
+    api_key: str = Field("", validation_alias="OPENAI_API_KEY")
+    base_url: str = Field("", validation_alias="OPENAI_BASE_URL")  # e.g. "http://localhost:8000/v1"
+    client_type: str = Field("", validation_alias="CLIENT_TYPE")
+    openai_model: Optional[str] = Field(None, validation_alias="OPENAI_MODEL")
+    azure_endpoint: Optional[str] = Field(None, validation_alias="AZURE_OPENAI_ENDPOINT")
+    azure_deployment: Optional[str] = Field(None, validation_alias="AZURE_DEPLOYMENT")
+    azure_api_key: Optional[str] = Field(None, validation_alias="AZURE_API_KEY")
+    exit_commands: FrozenSet[str] = frozenset({"/exit", "/quit"})
+    http_pool_size: int = Field(128, validation_alias="HTTP_POOL_SIZE")
+
+    @property
+    def use_azure(self) -> bool:
+        return self.client_type == "azure"
+
+    @property
+    def model(self) -> Optional[str]:
+        return self.azure_deployment if self.use_azure else self.openai_model
+
+
+settings = Settings()
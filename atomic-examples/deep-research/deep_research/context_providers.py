@@ -13,7 +13,18 @@ class ContentItem:
 class ScrapedContentContextProvider(SystemPromptContextProviderBase):
     def __init__(self, title: str):
         super().__init__(title=title)
-        self.content_items: List[ContentItem] = []
+        self.version = 0
+        self._content_items: List[ContentItem] = []
+
+    @property
+    def content_items(self) -> List[ContentItem]:
+        return self._content_items
+
+    @content_items.setter
+    def content_items(self, items: List[ContentItem]) -> None:
+        # Bumping the version invalidates the agents' cached system prompt.
+        self._content_items = items
+        self.version += 1
 
     def get_info(self) -> str:
         return "\n\n".join(
@@ -29,5 +40,11 @@ class CurrentDateContextProvider(SystemPromptContextProviderBase):
         super().__init__(title=title)
         self.date_format = date_format
 
+    @property
+    def version(self) -> str:
+        # The rendered date doubles as the version, so the agents' cached system
+        # prompt is regenerated exactly when the formatted date changes.
+        return datetime.now().strftime(self.date_format)
+
     def get_info(self) -> str:
         return f"The current date in the format {self.date_format} is {datetime.now().strftime(self.date_format)}."